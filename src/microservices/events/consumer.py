@@ -0,0 +1,114 @@
+import logging
+import os
+import threading
+from queue import Queue
+
+import orjson
+from confluent_kafka import Consumer, TopicPartition
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Kafka configuration
+kafka_brokers = os.getenv('KAFKA_BROKERS', 'kafka:9092').split(',')
+topics = ['movie-events', 'user-events', 'payment-events']
+
+# Batches waiting for a topic's worker; when full, polling blocks until the
+# worker catches up
+BATCH_QUEUE_SIZE = 4
+
+
+def decode_events(topic_name, values):
+    """Decode a batch of raw message values, skipping any that are not JSON."""
+    try:
+        return [orjson.loads(value) for value in values]
+    except orjson.JSONDecodeError:
+        events = []
+        for value in values:
+            try:
+                events.append(orjson.loads(value))
+            except orjson.JSONDecodeError as e:
+                logger.warning("[%s] Skipping undecodable event: %s", topic_name, e)
+        return events
+
+
+def handle_events(topic_name, events, last_offset):
+    """Process one decoded batch of events from a topic."""
+    if logger.isEnabledFor(logging.DEBUG):
+        for event in events:
+            logger.debug("[%s] Received event: %s", topic_name, event)
+    logger.info("[%s] processed %d messages, last_offset=%d", topic_name, len(events), last_offset)
+
+
+def process_batches(consumer, topic_name, batches):
+    """Drain batches handed off by consume_topic and store their offsets once processed.
+
+    A batch that fails is logged and skipped: the next successful batch
+    stores higher offsets for the same partitions, so it is not redelivered.
+    """
+    while True:
+        values, last_offset, offsets = batches.get()
+        try:
+            handle_events(topic_name, decode_events(topic_name, values), last_offset)
+            consumer.store_offsets(offsets=[
+                TopicPartition(topic_name, partition, offset + 1)
+                for partition, offset in offsets.items()
+            ])
+        except Exception:
+            logger.exception("[%s] Failed to process batch ending at offset %d", topic_name, last_offset)
+
+
+def consume_topic(topic_name):
+    """Fetch events from a single topic in bulk and hand them to a worker thread."""
+    # Offsets are auto-committed only after the worker has stored them for
+    # a processed batch, so events fetched but not yet handled when the
+    # process dies are redelivered after a restart. A batch whose processing
+    # raises is logged and skipped, not retried: delivery is at-least-once
+    # across crashes only, and failed batches are lost.
+    consumer = Consumer({
+        'bootstrap.servers': ','.join(kafka_brokers),
+        'group.id': 'events-service',
+        'auto.offset.reset': 'latest',
+        'enable.auto.offset.store': False,
+    })
+    consumer.subscribe([topic_name])
+    logger.info("Started consumer for topic: %s", topic_name)
+
+    batches = Queue(maxsize=BATCH_QUEUE_SIZE)
+    threading.Thread(target=process_batches, args=(consumer, topic_name, batches), daemon=True).start()
+
+    while True:
+        messages = consumer.consume(num_messages=500, timeout=1.0)
+        if not messages:
+            continue
+
+        values = []
+        last_offset = -1
+        offsets = {}
+        for message in messages:
+            if message.error():
+                logger.error("[%s] Consumer error: %s", topic_name, message.error())
+                continue
+            values.append(message.value())
+            last_offset = message.offset()
+            offsets[message.partition()] = last_offset
+        if values:
+            batches.put((values, last_offset, offsets))
+
+
+def start_consumers():
+    threads = []
+    for topic in topics:
+        thread = threading.Thread(target=consume_topic, args=(topic,), daemon=True)
+        thread.start()
+        threads.append(thread)
+    return threads
+
+
+if __name__ == '__main__':
+    logger.info("Starting events consumers")
+    for thread in start_consumers():
+        thread.join()
@@ -0,0 +1,21 @@
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8082')}"
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+
+def post_worker_init(worker):
+    # librdkafka producers are not fork-safe, so every worker builds its own
+    # after the fork rather than on its first request.
+    from main import get_producer
+    get_producer()
+
+
+def worker_exit(server, worker):
+    # Flush here rather than relying on the daemon poll thread, which dies
+    # with the worker and would drop events that were already answered 202.
+    from main import flush_producer
+    flush_producer()
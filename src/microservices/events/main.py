@@ -0,0 +1,184 @@
+import logging
+import os
+import secrets
+import threading
+from datetime import datetime, timezone
+
+import orjson
+from flask import Flask, jsonify, request
+from flask_orjson import OrjsonProvider
+from confluent_kafka import KafkaError, KafkaException, Producer
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Kafka configuration
+kafka_brokers = os.getenv('KAFKA_BROKERS', 'kafka:9092').split(',')
+
+MOVIE_EVENT_TYPE = 'movie'
+USER_EVENT_TYPE = 'user'
+PAYMENT_EVENT_TYPE = 'payment'
+
+_REQ_MOVIE = frozenset(('movie_id', 'title', 'action'))
+_REQ_USER = frozenset(('user_id', 'action', 'timestamp'))
+_REQ_PAY = frozenset(('payment_id', 'user_id', 'amount', 'status', 'timestamp'))
+
+# Per-process producer lifecycle: get_producer() builds it after the fork
+# (librdkafka producers are not fork-safe), and flush_producer() drains it
+# when the worker exits. Both are wired up in gunicorn.conf.py.
+_producer = None
+_producer_lock = threading.Lock()
+
+# Seconds a worker waits at exit for queued events to be delivered
+PRODUCER_FLUSH_TIMEOUT = 10
+
+
+def get_producer():
+    """Return this process's Kafka producer, creating it on first use."""
+    global _producer
+    if _producer is None:
+        with _producer_lock:
+            if _producer is None:
+                # Producer batching: wait up to 20ms so concurrent handlers
+                # share one ProduceRequest, and compress each batch with lz4.
+                # Idempotence keeps retried batches free of duplicates and in
+                # order with 5 in flight.
+                producer = Producer({
+                    'bootstrap.servers': ','.join(kafka_brokers),
+                    'linger.ms': 20,
+                    'batch.num.messages': 10000,
+                    'batch.size': 64 * 1024,
+                    'compression.type': 'lz4',
+                    'enable.idempotence': True,
+                    'acks': 'all',
+                    'retries': 10,
+                    'max.in.flight.requests.per.connection': 5,
+                    'delivery.timeout.ms': 120000,
+                })
+                threading.Thread(target=poll_producer, args=(producer,), daemon=True).start()
+                _producer = producer
+    return _producer
+
+
+def flush_producer(timeout=PRODUCER_FLUSH_TIMEOUT):
+    """Deliver events still queued in this process's producer before exit.
+
+    Handlers answer 202 once an event is queued, so anything left in
+    librdkafka at shutdown would otherwise be dropped without a trace.
+    """
+    producer = _producer
+    if producer is None:
+        return
+    remaining = producer.flush(timeout)
+    if remaining:
+        logger.error("%d events still queued after %ss flush; they are lost", remaining, timeout)
+
+
+def poll_producer(producer):
+    """Serve delivery callbacks for messages sent by request handlers."""
+    while True:
+        producer.poll(0.1)
+
+
+def on_delivery(err, msg):
+    if err is not None:
+        logger.error("Failed to deliver event: %s", err)
+        return
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Delivered event to %s [%d] at offset %d", msg.topic(), msg.partition(), msg.offset())
+
+
+def produce_sync(topic, key, value, timeout=10):
+    """Send one message and wait for the broker to acknowledge it."""
+    delivered = threading.Event()
+    result = {}
+
+    def on_sync_delivery(err, msg):
+        result['err'] = err
+        result['msg'] = msg
+        delivered.set()
+
+    get_producer().produce(topic, key=key, value=value, on_delivery=on_sync_delivery)
+    if not delivered.wait(timeout):
+        raise KafkaException(KafkaError(KafkaError._MSG_TIMED_OUT))
+    if result['err'] is not None:
+        raise KafkaException(result['err'])
+    return result['msg']
+
+
+@app.route('/api/events/health', methods=['GET'])
+def health():
+    try:
+        get_producer().list_topics('movie-events', timeout=2)
+    except KafkaException as e:
+        logger.error("Kafka health check failed: %s", e)
+        return jsonify({"status": False}), 503
+    return jsonify({"status": True})
+
+
+def make_event_handler(topic, required, event_type, id_field, key_field, timestamp_field=None):
+    """Build a POST view that validates a payload and publishes it to topic.
+
+    When timestamp_field is None the event is stamped with the current UTC
+    time; otherwise the client-supplied value is used.
+    """
+    def view():
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return jsonify({"error": "Request body must be a JSON object"}), 400
+
+        missing = required.difference(data)
+        if missing:
+            return jsonify({"error": f"Missing required fields: {sorted(missing)}"}), 400
+
+        if timestamp_field is None:
+            timestamp = datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+        else:
+            timestamp = data[timestamp_field]
+        event = {
+            "id": f"{event_type}-{data[id_field]}-{secrets.token_hex(4)}",
+            "type": event_type,
+            "timestamp": timestamp,
+            "payload": data
+        }
+        key = str(data[key_field])
+
+        try:
+            if request.args.get('sync') == '1':
+                msg = produce_sync(topic, key, orjson.dumps(event))
+                return jsonify({
+                    "status": "success",
+                    "partition": msg.partition(),
+                    "offset": msg.offset(),
+                    "event": event
+                }), 201
+            get_producer().produce(topic, key=key, value=orjson.dumps(event), on_delivery=on_delivery)
+            return jsonify({"status": "accepted", "event": event}), 202
+        except (KafkaException, BufferError) as e:
+            logger.error("Failed to send %s event: %s", event_type, e)
+            return jsonify({"error": str(e)}), 500
+
+    return view
+
+
+app.add_url_rule(
+    '/api/events/movie', 'create_movie_event',
+    make_event_handler('movie-events', _REQ_MOVIE, MOVIE_EVENT_TYPE, 'movie_id', 'movie_id'),
+    methods=['POST'],
+)
+app.add_url_rule(
+    '/api/events/user', 'create_user_event',
+    make_event_handler('user-events', _REQ_USER, USER_EVENT_TYPE, 'user_id', 'user_id', 'timestamp'),
+    methods=['POST'],
+)
+app.add_url_rule(
+    '/api/events/payment', 'create_payment_event',
+    make_event_handler('payment-events', _REQ_PAY, PAYMENT_EVENT_TYPE, 'payment_id', 'payment_id', 'timestamp'),
+    methods=['POST'],
+)
@@ -0,0 +1,294 @@
+import json
+import logging
+import os
+import random
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Routing configuration, read once at startup
+MONOLITH_URL = os.getenv('MONOLITH_URL', 'http://monolith:8080')
+MOVIES_SERVICE_URL = os.getenv('MOVIES_SERVICE_URL', 'http://movies-service:8081')
+EVENTS_SERVICE_URL = os.getenv('EVENTS_SERVICE_URL', 'http://events-service:8082')
+GRADUAL_MIGRATION = os.getenv('GRADUAL_MIGRATION', 'false').lower() == 'true'
+MOVIES_MIGRATION_PERCENT = int(os.getenv('MOVIES_MIGRATION_PERCENT', '0'))
+MOVIES_MIGRATION_FRACTION = MOVIES_MIGRATION_PERCENT / 100.0
+
+# (path prefix, upstream base URL), first match wins; anything unmatched
+# goes to the monolith. None marks the gradually migrated movies route,
+# split between the movies service and the monolith per request.
+ROUTES = (
+    ('/api/movies/health', MOVIES_SERVICE_URL),
+    ('/api/events', EVENTS_SERVICE_URL),
+    ('/api/movies', None if GRADUAL_MIGRATION else MOVIES_SERVICE_URL),
+)
+
+# Headers that apply to a single connection and must not be forwarded
+HOP_BY_HOP_HEADERS = frozenset({
+    'host',
+    'connection',
+    'content-length',
+    'keep-alive',
+    'proxy-authenticate',
+    'proxy-authorization',
+    'proxy-connection',
+    'te',
+    'trailer',
+    'transfer-encoding',
+    'upgrade',
+})
+
+# Upstream bodies are relayed in chunks of this size instead of buffered
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Text responses larger than GZIP_MIN_SIZE bytes are gzipped for clients
+# that accept it; level 1 keeps the CPU cost low for ~3x smaller JSON
+COMPRESSIBLE_TYPES = ('application/json', 'application/javascript', 'text/')
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 1
+
+# Shared session so upstream connections are kept alive and reused
+SESSION = requests.Session()
+# Forward only the client's own headers: requests' defaults would add
+# Accept-Encoding: gzip, deflate, and the body is relayed undecoded
+SESSION.headers.clear()
+_adapter = HTTPAdapter(pool_connections=64, pool_maxsize=256, max_retries=0)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+# Per-thread RNG, so request threads don't contend on the random module's
+# shared generator
+_thread_local = threading.local()
+
+
+def _rng():
+    rng = getattr(_thread_local, 'rng', None)
+    if rng is None:
+        rng = _thread_local.rng = random.Random()
+    return rng
+
+
+def _accepts_gzip(accept_encoding):
+    """Whether an Accept-Encoding value allows gzip; q=0 means refused."""
+    gzip_q = None
+    star_q = None
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if coding not in ('gzip', 'x-gzip', '*'):
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding == '*':
+            star_q = q
+        else:
+            gzip_q = q
+    if gzip_q is None:
+        gzip_q = star_q
+    return gzip_q is not None and gzip_q > 0
+
+
+def _add_vary(vary, header):
+    """Merge header into an existing Vary value without duplicating it."""
+    if not vary:
+        return header
+    fields = {field.strip().lower() for field in vary.split(',')}
+    if header.lower() in fields or '*' in fields:
+        return vary
+    return f"{vary}, {header}"
+
+
+class ProxyHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so streamed responses can use chunked transfer encoding
+    protocol_version = 'HTTP/1.1'
+    # Drop idle keep-alive connections so they don't pin a server thread
+    timeout = 60
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_response(200, {'Content-Type': 'application/json'},
+                                json.dumps({"status": True}).encode('utf-8'))
+            return
+        self._proxy_request('GET')
+
+    def do_POST(self):
+        self._proxy_request('POST')
+
+    def do_PUT(self):
+        self._proxy_request('PUT')
+
+    def do_DELETE(self):
+        self._proxy_request('DELETE')
+
+    def _determine_target(self, path):
+        """Pick the upstream URL for a request path."""
+        for prefix, base_url in ROUTES:
+            if path.startswith(prefix):
+                break
+        else:
+            return MONOLITH_URL + path
+
+        if base_url is None:
+            if _rng().random() < MOVIES_MIGRATION_FRACTION:
+                logger.debug("Routing %s to movies service", path)
+                base_url = MOVIES_SERVICE_URL
+            else:
+                logger.debug("Routing %s to monolith", path)
+                base_url = MONOLITH_URL
+        return base_url + path
+
+    def _proxy_request(self, method):
+        target_url = self._determine_target(self.path)
+
+        # Transfer-Encoding is stripped before forwarding, and an unread
+        # chunked body would be parsed as the next request on this
+        # connection, so only Content-Length bodies are accepted.
+        if 'Transfer-Encoding' in self.headers:
+            self.close_connection = True
+            self.send_error(411, 'Content-Length required')
+            return
+
+        # An unparseable length leaves the body's end unknown on a persistent
+        # connection, so reject it rather than risk reading it as a request.
+        try:
+            content_length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            content_length = -1
+        if content_length < 0:
+            self.close_connection = True
+            self.send_error(400, 'Invalid Content-Length')
+            return
+        body = self.rfile.read(content_length) if content_length > 0 else None
+
+        headers = {}
+        for key, value in self.headers.items():
+            if key.lower() not in HOP_BY_HOP_HEADERS:
+                headers[key] = value
+        if 'Accept-Encoding' not in self.headers:
+            headers['Accept-Encoding'] = 'identity'
+
+        try:
+            response = SESSION.request(
+                method=method,
+                url=target_url,
+                headers=headers,
+                data=body,
+                timeout=(3, 30),
+                stream=True,
+            )
+        except Exception as e:
+            logger.error("Error proxying request to %s: %s", target_url, e)
+            self._send_response(502, {'Content-Type': 'application/json'},
+                                json.dumps({"error": str(e)}).encode('utf-8'))
+            return
+
+        try:
+            self._stream_response(response)
+        except Exception as e:
+            # Headers are already on the wire, so the only option is to drop
+            # the connection and let the client see a truncated body.
+            logger.error("Error streaming response from %s: %s", target_url, e)
+            self.close_connection = True
+        finally:
+            response.close()
+
+    def _stream_response(self, response):
+        """Relay an upstream response to the client chunk by chunk."""
+        self.send_response(response.status_code)
+        for key, value in response.headers.items():
+            # send_response() already emits our own Server and Date; Vary is
+            # sent below, merged with Accept-Encoding when needed
+            if key.lower() not in HOP_BY_HOP_HEADERS and key.lower() not in ('server', 'date', 'vary'):
+                self.send_header(key, value)
+
+        vary = response.headers.get('Vary')
+        if response.status_code in (204, 304) or response.status_code < 200:
+            if vary:
+                self.send_header('Vary', vary)
+            self.end_headers()
+            return
+
+        compressor = None
+        if self._compressible(response):
+            vary = _add_vary(vary, 'Accept-Encoding')
+            if _accepts_gzip(self.headers.get('Accept-Encoding', '')):
+                compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        if vary:
+            self.send_header('Vary', vary)
+
+        # Uncompressed bytes are relayed as received, so any Content-Encoding
+        # and Content-Length from upstream still describe the body.
+        content_length = response.headers.get('Content-Length')
+        chunked = content_length is None or compressor is not None
+        if compressor is not None:
+            self.send_header('Content-Encoding', 'gzip')
+        if chunked:
+            self.send_header('Transfer-Encoding', 'chunked')
+        else:
+            self.send_header('Content-Length', content_length)
+        self.end_headers()
+
+        for chunk in response.raw.stream(STREAM_CHUNK_SIZE, decode_content=False):
+            if compressor is not None:
+                chunk = compressor.compress(chunk)
+            self._write_body(chunk, chunked)
+        if compressor is not None:
+            self._write_body(compressor.flush(), chunked)
+        if chunked:
+            self.wfile.write(b'0\r\n\r\n')
+
+    @staticmethod
+    def _compressible(response):
+        """Whether the proxy should gzip this upstream response itself."""
+        if 'Content-Encoding' in response.headers:
+            return False
+        content_type = response.headers.get('Content-Type', '').lower()
+        if not content_type.startswith(COMPRESSIBLE_TYPES):
+            return False
+        content_length = response.headers.get('Content-Length')
+        return content_length is None or (content_length.isdigit() and int(content_length) > GZIP_MIN_SIZE)
+
+    def _write_body(self, data, chunked):
+        if not data:
+            return
+        if chunked:
+            self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+        else:
+            self.wfile.write(data)
+
+    def _send_response(self, status_code, headers, content):
+        self.send_response(status_code)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+def main():
+    port = int(os.getenv('PORT', 8000))
+    # One thread per connection, so a slow upstream call does not block
+    # other clients; upstream connections come from the shared SESSION pool.
+    server = ThreadingHTTPServer(('0.0.0.0', port), ProxyHandler)
+    server.daemon_threads = True
+    logger.info("Starting proxy service on port %d", port)
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()